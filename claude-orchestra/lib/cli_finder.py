@@ -2,17 +2,24 @@
 Side-effect-free CLI path resolution utilities.
 
 v13 C-5: Extracted from codex_wrapper to avoid circular imports.
-Used by both codex_wrapper and env_check.
+Used by codex_wrapper, env_check and gemini_wrapper.
 """
+import functools
 import os
 import shutil
 import subprocess
 from pathlib import Path
 
 
+@functools.cache
+def cached_which(tool: str) -> str | None:
+    """shutil.which, cached per process (each PATH scan is a stat per directory)."""
+    return shutil.which(tool)
+
+
 def find_node() -> str:
     """Find Node.js executable path."""
-    path = shutil.which("node")
+    path = cached_which("node")
     if path:
         return path
     # Windows common locations
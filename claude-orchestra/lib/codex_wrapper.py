@@ -12,9 +12,7 @@ v18 consolidated version (v10 base + v12-v17 changes):
 """
 import json
 import os
-import shutil
 import subprocess
-import tempfile
 from pathlib import Path
 
 from cli_finder import find_node, find_codex_js
@@ -120,6 +118,7 @@ def call_codex(mode: str, context: str, timeout: int = 300, source_files: list[s
             pass  # Fall through to stage 2
 
         # --- Stage 2: Temp file output via -o (prompt via stdin) ---
+        import tempfile  # fallback path only; keeps it off the import chain
         output_path = None
         try:
             out_tmp = tempfile.NamedTemporaryFile(
@@ -223,11 +223,11 @@ def guard_context(content: str, source_files: list[str] = None) -> str:
     """
     Main entry point: validate and sanitize content before external transmission.
 
-    v14 redesign:
-    1. Enforce size limit FIRST (D-6: performance)
-    2. Policy check for unknown origin (D-1: source_files=None handling)
-    3. Enforce allowed base directories
-    4. Check file allowlist (blocked extensions/patterns)
+    v14 redesign (cheapest rejection first):
+    1. Policy check for unknown origin (D-1: source_files=None handling)
+    2. Check file allowlist (blocked extensions/patterns, string-only)
+    3. Enforce allowed base directories (path resolution)
+    4. Enforce size limit (D-6: truncate before expensive scan)
     5. Scan for secrets
     6. Apply consent policy (D-4: block/redact/require_allowlist)
 
@@ -246,13 +246,8 @@ def guard_context(content: str, source_files: list[str] = None) -> str:
     Raises:
         ContextGuardError: If content is blocked by policy
     """
-    # Step 1: Size limit FIRST (v14 D-6: truncate before expensive scan)
-    truncated = False
-    if len(content) > MAX_CONTEXT_SIZE:
-        content = content[:MAX_CONTEXT_SIZE] + "\n\n[TRUNCATED: content exceeded size limit]"
-        truncated = True
-
-    # Step 2: Unknown origin policy (v14 D-1, v16 F-1, v17 H-1: strict origin)
+    # Step 1: Unknown origin policy (v14 D-1, v16 F-1, v17 H-1: strict origin)
+    # Runs before any content work so rejected calls never pay for truncation/scanning.
     policy = _get_consent_policy()  # v16 F-4: resolve per-call
     if not source_files:  # None or empty list
         if policy == "require_allowlist":
@@ -278,9 +273,18 @@ def guard_context(content: str, source_files: list[str] = None) -> str:
                    f"No source_files provided, policy={policy}. "
                    "File allowlist/blocklist checks skipped. "
                    "Set ORCHESTRA_CONSENT_POLICY=require_allowlist or provide source_files.")
+    else:
+        # Step 2: File allowlist check (blocked extensions/patterns, v16 F-1)
+        # Pure string matching, so it runs before the path resolution in Step 3.
+        blocked = [f for f in source_files if not check_file_allowed(f)]
+        if blocked:
+            _audit_log("blocked_files", f"Blocked by pattern: {blocked}")
+            raise ContextGuardError(
+                f"Blocked files detected: {', '.join(blocked)}. "
+                "These files may contain secrets and cannot be sent to external agents."
+            )
 
-    # Step 3: Enforce allowed base directories (v13 C-1, v16 F-1, v17 G-1: per-call)
-    if source_files is not None and len(source_files) > 0:
+        # Step 3: Enforce allowed base directories (v13 C-1, v16 F-1, v17 G-1: per-call)
         dir_violations = enforce_allowed_dirs(source_files)
         if dir_violations:
             allowed_dirs = _build_allowed_dirs()  # v17 G-1: for error message
@@ -290,15 +294,9 @@ def guard_context(content: str, source_files: list[str] = None) -> str:
                 f"Only files under {[str(d) for d in allowed_dirs]} are permitted."
             )
 
-    # Step 4: File allowlist check (blocked extensions/patterns, v16 F-1)
-    if source_files is not None and len(source_files) > 0:
-        blocked = [f for f in source_files if not check_file_allowed(f)]
-        if blocked:
-            _audit_log("blocked_files", f"Blocked by pattern: {blocked}")
-            raise ContextGuardError(
-                f"Blocked files detected: {', '.join(blocked)}. "
-                "These files may contain secrets and cannot be sent to external agents."
-            )
+    # Step 4: Size limit (v14 D-6: truncate before expensive scan)
+    if len(content) > MAX_CONTEXT_SIZE:
+        content = content[:MAX_CONTEXT_SIZE] + "\n\n[TRUNCATED: content exceeded size limit]"
 
     # Step 5: Scan for secrets
     findings = scan_secrets(content)
@@ -4,15 +4,16 @@ Environment prerequisites validation.
 Checks CLI tools, model availability, and runtime requirements
 before Orchestra operations. Provides graceful degradation info.
 """
-import shutil
 import subprocess
 import json
 from pathlib import Path
 
+from cli_finder import cached_which
+
 
 def check_node() -> dict:
     """Check Node.js availability."""
-    path = shutil.which("node")
+    path = cached_which("node")
     if not path:
         return {"available": False, "error": "Node.js not found"}
     try:
@@ -47,7 +48,7 @@ def check_codex() -> dict:
 
 def check_gemini() -> dict:
     """Check Gemini CLI availability."""
-    path = shutil.which("gemini")
+    path = cached_which("gemini")
     if not path:
         return {"available": False, "error": "Gemini CLI not found", "degradation": "Research tasks handled by Claude Code WebSearch"}
     try:
@@ -64,7 +65,7 @@ def check_python_tools() -> dict:
     """Check optional Python tools (ruff, ty, uv)."""
     tools = {}
     for tool in ["ruff", "ty", "uv"]:
-        path = shutil.which(tool)
+        path = cached_which(tool)
         if path:
             try:
                 r = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=5, shell=False)
@@ -104,11 +105,26 @@ def full_check() -> dict:
             }
         }
     """
-    node = check_node()
-    codex = check_codex()
-    gemini = check_gemini()
-    python_tools = check_python_tools()
-    vault = check_vault()
+    from concurrent.futures import ThreadPoolExecutor  # only full_check needs the pool
+
+    # Each check is dominated by a --version subprocess; run them concurrently
+    with ThreadPoolExecutor() as pool:
+        futures = {
+            name: pool.submit(check)
+            for name, check in (
+                ("node", check_node),
+                ("codex", check_codex),
+                ("gemini", check_gemini),
+                ("python_tools", check_python_tools),
+                ("vault", check_vault),
+            )
+        }
+    results = {name: future.result() for name, future in futures.items()}
+    node = results["node"]
+    codex = results["codex"]
+    gemini = results["gemini"]
+    python_tools = results["python_tools"]
+    vault = results["vault"]
 
     capabilities = {
         "codex_delegation": node.get("available", False) and codex.get("available", False),
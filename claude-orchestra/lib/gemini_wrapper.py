@@ -11,11 +11,10 @@ v18 consolidated version (v10 base + v12-v17 changes):
 """
 import json
 import os
-import shutil
 import subprocess
-import tempfile
 from pathlib import Path
 
+from cli_finder import cached_which
 from context_guard import guard_context, ContextGuardError
 from output_schemas import validate_output, make_error_response  # v19 L-5: add make_error_response
 from budget import check_budget, acquire_slot, release_slot, record_call
@@ -27,7 +26,7 @@ def find_gemini() -> str | None:
     Resolve Gemini CLI executable path.
     Returns None if not installed (graceful skip).
     """
-    path = shutil.which("gemini")
+    path = cached_which("gemini")
     if path:
         return path
     return None
@@ -0,0 +1,23 @@
+"""Run-scoped stat/read cache for deployed files (hooks, skill prompts).
+
+Deployed files are treated as static for the duration of a run, so an edit
+made mid-run is not picked up.
+"""
+import functools
+import os
+from pathlib import Path
+
+
+@functools.lru_cache(maxsize=None)
+def cached_stat(path: Path) -> os.stat_result | None:
+    """stat() of a deployed file, cached for the run; None when missing."""
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def cached_read_text(path: Path) -> str:
+    """UTF-8 text of a deployed file, read once per run."""
+    return path.read_text(encoding="utf-8")
@@ -0,0 +1,29 @@
+"""Run a batch of hook invocations in one interpreter.
+
+Usage: python _hook_batch_runner.py < requests.json
+
+stdin is a JSON array of {"hook": str, "stdin": str}; stdout is a JSON array
+of {"stdout": str, "stderr": str, "returncode": int} in the same order. Each
+hook is executed in-process (runpy, see _hook_server.run_hook_in_process), so
+a whole fail-safe matrix pays interpreter startup once instead of per case.
+"""
+import json
+import os
+import sys
+
+from _hook_server import run_hook_in_process
+
+
+def main() -> None:
+    requests = json.load(sys.stdin.buffer)
+    # Keep the real stdout for the result and point fd 1 at stderr, so
+    # subprocesses spawned by hooks (e.g. orchestrators) can't corrupt it.
+    result_fd = os.dup(sys.__stdout__.fileno())
+    os.dup2(sys.__stderr__.fileno(), sys.__stdout__.fileno())
+    results = [run_hook_in_process(r["hook"], r["stdin"]) for r in requests]
+    with os.fdopen(result_fd, "wb") as out:
+        out.write(json.dumps(results).encode("utf-8"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""Persistent hook runner for hook integration tests.
+
+Hook scripts are one-shot programs (read JSON from stdin, print JSON, exit).
+Spawning a fresh interpreter per test case makes CPython startup dominate the
+hook test matrix, so this module runs hooks in-process via runpy inside one
+long-lived server process and reuses it across many invocations.
+
+Protocol (newline-delimited JSON over the server's stdin/stdout):
+    request:  {"hook": str, "stdin": str} + b"\n"
+    response: {"stdout": str, "stderr": str, "returncode": int} + b"\n"
+
+json.dumps escapes embedded newlines, so every message is exactly one line.
+The client talks to the unbuffered pipes with os.write/os.read directly.
+
+Run as a script to start the server; import HookPool (or HookWorker for a
+single server) for the client side.
+"""
+import io
+import json
+import os
+import runpy
+import subprocess
+import sys
+import threading
+import traceback
+
+
+class _Capture(io.BytesIO):
+    """BytesIO that survives close(), so hooks that rewrap sys.stdout keep output."""
+
+    def close(self) -> None:
+        pass
+
+
+def _exit_code(code) -> tuple[int, str]:
+    """Map SystemExit.code to (returncode, stderr text) like the interpreter does."""
+    if code is None:
+        return 0, ""
+    if isinstance(code, int):
+        return code, ""
+    return 1, f"{code}\n"
+
+
+def run_hook_in_process(hook_path: str, stdin_text: str) -> dict:
+    """
+    Execute a hook script as __main__ with redirected stdio.
+
+    os.environ, sys.path, sys.argv and sys.modules are restored afterwards.
+    Modules first imported by the hook are dropped, so import-time side effects
+    (e.g. bootstrap's env normalization) run again on every invocation exactly
+    as they would in a fresh interpreter, instead of being undone by the
+    os.environ restore and then skipped as already imported.
+
+    Returns:
+        {"stdout": str, "stderr": str, "returncode": int}
+    """
+    saved = (
+        dict(os.environ), list(sys.path), sys.argv, sys.stdin, sys.stdout, sys.stderr
+    )
+    saved_modules = dict(sys.modules)
+    out_buf, err_buf = _Capture(), _Capture()
+    sys.argv = [hook_path]
+    stdin_buf = io.BytesIO(stdin_text.encode("utf-8"))
+    sys.stdin = io.TextIOWrapper(stdin_buf, encoding="utf-8")
+    sys.stdout = io.TextIOWrapper(out_buf, encoding="utf-8", write_through=True)
+    sys.stderr = io.TextIOWrapper(err_buf, encoding="utf-8", write_through=True)
+    returncode = 0
+    try:
+        runpy.run_path(hook_path, run_name="__main__")
+    except SystemExit as e:
+        returncode, message = _exit_code(e.code)
+        if message:
+            sys.stderr.write(message)
+    except Exception:
+        traceback.print_exc()
+        returncode = 1
+    finally:
+        # Hooks may have replaced sys.stdout/sys.stderr with their own wrappers
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+        env, path, sys.argv, sys.stdin, sys.stdout, sys.stderr = saved
+        sys.path[:] = path
+        os.environ.clear()
+        os.environ.update(env)
+        for name in sys.modules.keys() - saved_modules.keys():
+            del sys.modules[name]
+        sys.modules.update(saved_modules)
+    return {
+        "stdout": out_buf.getvalue().decode("utf-8", errors="replace"),
+        "stderr": err_buf.getvalue().decode("utf-8", errors="replace"),
+        "returncode": returncode,
+    }
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def serve() -> None:
+    """Serve newline-delimited hook requests until stdin is closed."""
+    # Keep a private handle on the protocol pipe and point fd 1 at stderr, so
+    # subprocesses spawned by hooks (e.g. orchestrators) can't corrupt the stream.
+    proto_out = os.dup(sys.__stdout__.fileno())
+    os.dup2(sys.__stderr__.fileno(), sys.__stdout__.fileno())
+    for line in sys.__stdin__.buffer:
+        request = json.loads(line)
+        response = run_hook_in_process(request["hook"], request["stdin"])
+        _write_all(proto_out, json.dumps(response).encode("utf-8") + b"\n")
+
+
+class HookWorker:
+    """Client for one long-lived hook server process.
+
+    Requests go straight to the pipe fds (bufsize=0): no communicate(), no
+    reader thread. A lock serializes request/response pairs on the pipe.
+    """
+
+    def __init__(self, python: str = sys.executable):
+        self._proc = subprocess.Popen(
+            [python, "-u", __file__],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+            shell=False,
+            close_fds=False,  # keeps the posix_spawn fast path before Python 3.13
+        )
+        self._fd_in = self._proc.stdin.fileno()
+        self._fd_out = self._proc.stdout.fileno()
+        self._lock = threading.Lock()
+        self._buf = bytearray()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def _readline(self, hook_path: str, timeout: float) -> bytes:
+        # A watchdog thread kills the server on timeout, which turns the blocked
+        # os.read into EOF (select() can't wait on pipes on Windows).
+        expired = threading.Event()
+
+        def _expire() -> None:
+            expired.set()
+            self.kill()
+
+        watchdog = threading.Timer(timeout, _expire)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            while (end := self._buf.find(b"\n")) < 0:
+                chunk = os.read(self._fd_out, 65536)
+                if not chunk:
+                    if expired.is_set():
+                        watchdog.join()  # let kill() finish reaping the server
+                        raise subprocess.TimeoutExpired(hook_path, timeout)
+                    raise RuntimeError("hook server exited")
+                self._buf += chunk
+        finally:
+            watchdog.cancel()
+        line = bytes(self._buf[:end])
+        del self._buf[:end + 1]
+        return line
+
+    def run(self, hook_path: str, stdin_text: str, timeout: float) -> dict:
+        """
+        Run one hook invocation on the server.
+
+        Raises:
+            subprocess.TimeoutExpired: no answer within timeout (server is killed)
+            RuntimeError: server died (hook could not be re-entered)
+        """
+        request = json.dumps({"hook": hook_path, "stdin": stdin_text}).encode("utf-8")
+        request += b"\n"
+        with self._lock:
+            try:
+                _write_all(self._fd_in, request)
+            except OSError as e:
+                raise RuntimeError(f"hook server unavailable: {e}") from e
+            return json.loads(self._readline(hook_path, timeout))
+
+    def kill(self) -> None:
+        """Kill a hung server right away instead of waiting for it to drain stdin."""
+        self._proc.kill()
+        self._proc.wait()
+
+    def close(self) -> None:
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        self._proc.stdout.close()
+
+
+# Hook launches must stay eligible for CPython's posix_spawn fast path: pass only
+# input/capture_output/timeout/shell plus close_fds=False (required before
+# Python 3.13; our fds are non-inheritable per PEP 446). Never add cwd, env,
+# preexec_fn, pass_fds or start_new_session — any of them forces fork+exec.
+_SPAWN_KWARGS = {"shell": False, "close_fds": False}
+
+
+def run_hook_subprocess(
+    hook_path: str, stdin_text: str, timeout: float, python: str = sys.executable
+) -> dict:
+    """One-shot launch; returns raw output in the same shape as HookWorker.run."""
+    result = subprocess.run(
+        [python, hook_path],
+        input=stdin_text.encode("utf-8"),
+        capture_output=True,
+        timeout=timeout,
+        **_SPAWN_KWARGS,
+    )
+    return {
+        "stdout": result.stdout.decode("utf-8", errors="replace"),
+        "stderr": result.stderr.decode("utf-8", errors="replace"),
+        "returncode": result.returncode,
+    }
+
+
+class HookPool:
+    """Long-lived hook servers, one per hook path, spawned lazily and reused.
+
+    A server killed by a timeout is replaced on the next call. A hook that
+    takes its server down (e.g. os._exit) is not re-entrant: it is recorded as
+    None and falls back to a one-shot subprocess from then on. Different hooks
+    may run concurrently from different threads.
+    """
+
+    def __init__(self, python: str = sys.executable):
+        self._python = python
+        self._workers: dict[str, HookWorker | None] = {}
+
+    def run(self, hook_path: str, stdin_text: str, timeout: float) -> dict:
+        """
+        Run one hook invocation and return its raw output.
+
+        Raises:
+            subprocess.TimeoutExpired: hook did not answer within timeout
+        """
+        if hook_path not in self._workers:
+            self._workers[hook_path] = HookWorker(self._python)
+        worker = self._workers[hook_path]
+        if worker is not None:
+            try:
+                return worker.run(hook_path, stdin_text, timeout)
+            except subprocess.TimeoutExpired:
+                worker.close()
+                del self._workers[hook_path]
+                raise
+            except RuntimeError:
+                worker.close()
+                self._workers[hook_path] = None
+        return run_hook_subprocess(hook_path, stdin_text, timeout, self._python)
+
+    def close(self) -> None:
+        for worker in self._workers.values():
+            if worker is not None:
+                worker.close()
+        self._workers.clear()
+
+
+if __name__ == "__main__":
+    serve()
@@ -2,20 +2,45 @@
 import json
 import os
 import sys
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--integration",
+        action="store_true",
+        default=False,
+        help="Run hook integration tests (same as ORCHESTRA_INTEGRATION=1)",
+    )
+
+
 def pytest_collection_modifyitems(config, items):
-    """Auto-skip E2E tests unless ORCHESTRA_E2E=1 is set."""
-    if os.environ.get("ORCHESTRA_E2E") == "1":
-        return
+    """Auto-skip E2E tests unless ORCHESTRA_E2E=1.
+
+    Integration tests are skipped unless ORCHESTRA_INTEGRATION=1 or --integration.
+    """
+    run_e2e = os.environ.get("ORCHESTRA_E2E") == "1"
+    # --integration is shorthand for ORCHESTRA_INTEGRATION=1
+    run_integration = (
+        config.getoption("--integration")
+        or os.environ.get("ORCHESTRA_INTEGRATION") == "1"
+    )
     skip_e2e = pytest.mark.skip(reason="Set ORCHESTRA_E2E=1 to run E2E tests")
+    skip_integration = pytest.mark.skip(
+        reason=(
+            "Set ORCHESTRA_INTEGRATION=1 (or pass --integration) "
+            "to run integration tests"
+        )
+    )
     for item in items:
-        if "e2e" in item.keywords:
+        if not run_e2e and "e2e" in item.keywords:
             item.add_marker(skip_e2e)
+        if not run_integration and "integration" in item.keywords:
+            item.add_marker(skip_integration)
 
 # Add repo lib directory to sys.path for imports (NOT ~/.claude/lib)
 _LIB_DIR = str(Path(__file__).resolve().parent.parent / "lib")
@@ -40,6 +65,28 @@ def isolate_env(tmp_path, monkeypatch):
     monkeypatch.setattr(context_guard, "_audit_log", _write_audit_log(log_dir))
 
 
+@pytest.fixture
+def clear_which_cache():
+    """Reset cli_finder.cached_which so a test's shutil.which mock is honoured."""
+    import cli_finder
+    cli_finder.cached_which.cache_clear()
+    yield
+    cli_finder.cached_which.cache_clear()
+
+
+@pytest.fixture
+def mocked_env(request):
+    """Patch several targets at once from request.param ({target: return_value}).
+
+    Use with indirect parametrization; yields {target: mock}.
+    """
+    with ExitStack() as stack:
+        yield {
+            target: stack.enter_context(patch(target, return_value=value))
+            for target, value in request.param.items()
+        }
+
+
 @pytest.fixture
 def mock_budget_file(tmp_path, monkeypatch):
     """Redirect budget state file to tmp_path and fix module-level defaults."""
@@ -65,29 +112,59 @@ def session_dir(tmp_path):
     return tmp_path
 
 
-@pytest.fixture
-def vault_dir(tmp_path):
-    """Create a fake Obsidian vault directory under tmp_path."""
-    vault = tmp_path / "vault" / "TetsuyaSynapse"
+def _make_vault(base: Path) -> Path:
+    """Create the fake Obsidian vault layout under base."""
+    vault = base / "vault" / "TetsuyaSynapse"
     (vault / "90-Claude" / "sessions").mkdir(parents=True)
     (vault / "90-Claude" / "decisions").mkdir(parents=True)
     (vault / "90-Claude" / "learnings").mkdir(parents=True)
     return vault
 
 
-@pytest.fixture
-def mock_vault(vault_dir, monkeypatch):
-    """Redirect vault_sync paths to tmp vault_dir."""
+def _redirect_vault_sync(mp: pytest.MonkeyPatch, vault_dir: Path) -> None:
+    """Point vault_sync's module paths at vault_dir and its sibling local cache."""
     import vault_sync
-    monkeypatch.setattr(vault_sync, "VAULT_ROOT", vault_dir)
-    monkeypatch.setattr(vault_sync, "VAULT_BASE", vault_dir / "90-Claude")
+    mp.setattr(vault_sync, "VAULT_ROOT", vault_dir)
+    mp.setattr(vault_sync, "VAULT_BASE", vault_dir / "90-Claude")
     local_cache = vault_dir.parent / "local_cache"
     local_cache.mkdir(parents=True, exist_ok=True)
-    monkeypatch.setattr(vault_sync, "LOCAL_CACHE", local_cache)
-    monkeypatch.setattr(vault_sync, "PENDING_FILE", local_cache / "pending_sync.txt")
+    mp.setattr(vault_sync, "LOCAL_CACHE", local_cache)
+    mp.setattr(vault_sync, "PENDING_FILE", local_cache / "pending_sync.txt")
+
+
+@pytest.fixture
+def vault_dir(tmp_path):
+    """Create a fake Obsidian vault directory under tmp_path."""
+    return _make_vault(tmp_path)
+
+
+@pytest.fixture
+def mock_vault(vault_dir, monkeypatch):
+    """Redirect vault_sync paths to tmp vault_dir."""
+    _redirect_vault_sync(monkeypatch, vault_dir)
     return vault_dir
 
 
+@pytest.fixture(scope="session")
+def vault_root_session(tmp_path_factory):
+    """Fake vault shared by the whole session.
+
+    Only for tests that read back their own writes.
+    """
+    return _make_vault(tmp_path_factory.mktemp("shared"))
+
+
+@pytest.fixture(scope="class")
+def shared_vault(vault_root_session):
+    """Class-scoped mock_vault over vault_root_session.
+
+    For fixtures that write once per class.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        _redirect_vault_sync(mp, vault_root_session)
+        yield vault_root_session
+
+
 def _write_audit_log(log_dir: Path):
     """Create a safe audit log writer that properly closes file handles."""
     def _writer(event, details):
@@ -7,6 +7,9 @@ import pytest
 import cli_finder
 
 
+pytestmark = pytest.mark.usefixtures("clear_which_cache")
+
+
 class TestFindNode:
     @patch("cli_finder.shutil.which", return_value="C:\\Program Files\\nodejs\\node.exe")
     def test_found_in_path(self, mock_which):
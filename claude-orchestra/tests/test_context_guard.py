@@ -183,6 +183,20 @@ class TestGuardContext:
         with pytest.raises(ContextGuardError, match="ORCHESTRA_STRICT_ORIGIN"):
             guard_context("some content", source_files=[])
 
+    def test_strict_origin_rejects_before_scanning(self, monkeypatch):
+        monkeypatch.setenv("ORCHESTRA_STRICT_ORIGIN", "1")
+        with patch.object(context_guard, "scan_secrets") as mock_scan:
+            with pytest.raises(ContextGuardError, match="ORCHESTRA_STRICT_ORIGIN"):
+                guard_context("x" * (MAX_CONTEXT_SIZE + 1000))
+        mock_scan.assert_not_called()
+
+    def test_blocked_file_rejects_before_dir_check(self, monkeypatch):
+        monkeypatch.setenv("ORCHESTRA_STRICT_ORIGIN", "1")
+        with patch.object(context_guard, "enforce_allowed_dirs") as mock_dirs:
+            with pytest.raises(ContextGuardError, match="Blocked files"):
+                guard_context("content", source_files=["C:\\totally\\other\\.env"])
+        mock_dirs.assert_not_called()
+
     def test_require_allowlist_blocks_no_source(self, monkeypatch):
         monkeypatch.setenv("ORCHESTRA_STRICT_ORIGIN", "0")
         monkeypatch.setenv("ORCHESTRA_CONSENT_POLICY", "require_allowlist")
@@ -3,13 +3,28 @@ fail-safe behavior, and JSON output format.
 
 These tests execute real hook scripts from ~/.claude/hooks/.
 Skipped when hooks are not deployed (CI environment).
+
+Hooks run inside persistent per-hook server processes (tests/_hook_server.py)
+so interpreter startup is paid once per hook rather than once per test case;
+the fail-safe / JSON-format matrix is batched onto the same pool, one thread
+per hook, under a single overall deadline.
+Safe to distribute with `pytest -n auto --dist=loadgroup`: the module is one
+xdist group, so all its cases land on a single worker and share its warm pool.
+
+The large and unicode fail-safe payloads are marked slow and deselected by the
+default addopts; the full run is `pytest -m ""`.
 """
+import functools
 import json
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
+from _file_cache import cached_read_text, cached_stat
+from _hook_server import HookPool
 
 HOOKS_DIR = Path.home() / ".claude" / "hooks"
 PYTHON = sys.executable
@@ -17,6 +32,8 @@ SETTINGS_PATH = Path.home() / ".claude" / "settings.json"
 
 pytestmark = [
     pytest.mark.e2e,
+    # One xdist worker owns this module's hook_workers pool (no shared pipes)
+    pytest.mark.xdist_group("hooks"),
     pytest.mark.skipif(
         not HOOKS_DIR.exists(),
         reason=f"Hook scripts not deployed at {HOOKS_DIR}",
@@ -36,27 +53,227 @@ ALL_HOOKS = [
     "suggest-gemini-research.py",
 ]
 
+# Fail-safe payloads, serialized once at import and shared by all hooks
+_PAYLOAD_NONE = json.dumps({
+    "tool_name": None,
+    "tool_input": None,
+    "prompt": None,
+    "result": None,
+})
+_PAYLOAD_NUMERIC = json.dumps({
+    "tool_name": 999,
+    "tool_input": 42,
+    "prompt": 0,
+})
+_PAYLOAD_EMPTY_STRINGS = json.dumps({
+    "tool_name": "",
+    "tool_input": "",
+    "prompt": "",
+    "result": "",
+})
+_PAYLOAD_UNICODE = json.dumps({
+    "tool_name": "Write",
+    "tool_input": {"file_path": "テスト.py"},
+    "prompt": "日本語プロンプト 🎉🚀",
+    "result": "結果: 成功 ✓",
+})
+_PAYLOAD_EMPTY_DICT = json.dumps({})
+
+# 50 KB fail-safe payload
+_BIG_X = "x" * 50000
+_BIG_Y = "y" * 50000
+_LARGE_PAYLOAD_JSON = json.dumps({
+    "tool_name": "Write",
+    "tool_input": {"file_path": "big.py"},
+    "prompt": _BIG_X,
+    "result": _BIG_Y,
+})
+
+# Standard Write payload for the output-format check, serialized once
+_STD_INPUT_JSON = json.dumps({
+    "tool_name": "Write",
+    "tool_input": {"file_path": "x.py"},
+})
+
+
+# Long-lived hook servers, one per hook, reused across parametrizations
+# (see _hook_server.HookPool)
+_pool = HookPool(PYTHON)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def hook_workers():
+    """Own the hook server pool for this module and shut it down afterwards."""
+    yield _pool
+    _pool.close()
+
+
+# Resolved once at import: cases are generated only for hooks that exist, and
+# test_all_hooks_present reports any missing ones a single time.
+_DEPLOYED_HOOKS = [h for h in ALL_HOOKS if cached_stat(HOOKS_DIR / h) is not None]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_hook(path: Path):
+    """Compile a hook in-process (no py_compile subprocess, no .pyc written)."""
+    return compile(cached_read_text(path), str(path), "exec")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_settings(mtime_ns: int) -> dict:
+    return json.loads(SETTINGS_PATH.read_text(encoding="utf-8"))
+
+
+def load_settings() -> dict:
+    """Parsed settings.json, re-read only when its mtime changes."""
+    return _load_settings(SETTINGS_PATH.stat().st_mtime_ns)
+
+
+def _parse_hook_output(stdout: str, stderr: str, returncode: int) -> dict:
+    """Parse decoded hook stdout as JSON, falling back to the raw text."""
+    if stdout.strip():
+        try:
+            return json.loads(stdout)
+        except json.JSONDecodeError:
+            return {"raw_output": stdout, "returncode": returncode}
+    return {"empty": True, "returncode": returncode, "stderr": stderr}
+
+
+def _is_json_object(data: str) -> bool:
+    """True if data is one well-formed JSON object."""
+    try:
+        return isinstance(json.loads(data), dict)
+    except json.JSONDecodeError:
+        return False
+
+
+def _run_hook_pooled(hook_name: str, stdin_json: str, timeout: float) -> dict:
+    """Run a hook on the pool and return the raw output (TimeoutExpired on a hang)."""
+    return _pool.run(str(HOOKS_DIR / hook_name), stdin_json, timeout)
+
 
 def run_hook(hook_name: str, stdin_data: dict, timeout: int = 15) -> dict:
     """Run a hook script with JSON stdin and capture JSON stdout."""
+    return run_hook_raw(hook_name, json.dumps(stdin_data), timeout)
+
+
+def run_hook_raw(hook_name: str, stdin_json: str, timeout: int = 15) -> dict:
+    """Like run_hook(), but takes an already-serialized JSON payload."""
     hook_path = HOOKS_DIR / hook_name
-    if not hook_path.exists():
+    if cached_stat(hook_path) is None:
         pytest.skip(f"Hook not found: {hook_path}")
+    out = _run_hook_pooled(hook_name, stdin_json, timeout)
+    return _parse_hook_output(out["stdout"], out["stderr"], out["returncode"])
+
+
+# Fail-safe payload set batched against every hook by the hook_runs fixture
+_FAILSAFE_PAYLOADS = {
+    "none": _PAYLOAD_NONE,
+    "numeric": _PAYLOAD_NUMERIC,
+    "empty_strings": _PAYLOAD_EMPTY_STRINGS,
+    "unicode": _PAYLOAD_UNICODE,
+    "empty_dict": _PAYLOAD_EMPTY_DICT,
+    "large": _LARGE_PAYLOAD_JSON,
+}
+# Long-pole payloads: marked slow so the default inner loop skips them
+_SLOW_PAYLOADS = {"unicode", "large"}
+_FAILSAFE_CASES = [
+    pytest.param(payload_id, marks=pytest.mark.slow)
+    if payload_id in _SLOW_PAYLOADS
+    else payload_id
+    for payload_id in _FAILSAFE_PAYLOADS
+]
 
-    result = subprocess.run(
-        [PYTHON, str(hook_path)],
-        input=json.dumps(stdin_data),
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-        shell=False,
-    )
-    if result.stdout.strip():
-        try:
-            return json.loads(result.stdout)
-        except json.JSONDecodeError:
-            return {"raw_output": result.stdout, "returncode": result.returncode}
-    return {"empty": True, "returncode": result.returncode, "stderr": result.stderr}
+# Everything the batch feeds each hook: the fail-safe set plus the standard
+# Write payload whose raw stdout TestHookOutputJsonFormat validates.
+_BATCH_PAYLOADS: dict[str, str] = {**_FAILSAFE_PAYLOADS, "std": _STD_INPUT_JSON}
+
+
+# Wall-clock budget for the whole batch. It runs in the setup of whichever
+# consuming test comes first, so it must finish well inside that test's
+# pytest-timeout; runs still pending at the deadline are reported as timed out.
+_BATCH_TIMEOUT = 10
+
+
+def _run_batch(hook_inputs: list[tuple[str, str, str]]) -> dict[tuple[str, str], dict]:
+    """
+    Run every (hook_name, payload_id, stdin_json) on the persistent hook pool.
+
+    Each hook's payloads run in order on its own server, and the hooks run
+    concurrently, one thread each (the threads only wait on server pipes).
+    """
+    deadline = time.monotonic() + _BATCH_TIMEOUT
+    by_hook: dict[str, list[tuple[str, str]]] = {}
+    for hook_name, payload_id, payload in hook_inputs:
+        by_hook.setdefault(hook_name, []).append((payload_id, payload))
+
+    def _one_hook(hook_name: str, runs: list[tuple[str, str]]) -> dict:
+        results = {}
+        for payload_id, payload in runs:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(hook_name, _BATCH_TIMEOUT)
+                results[(hook_name, payload_id)] = _run_hook_pooled(
+                    hook_name, payload, remaining
+                )
+            except subprocess.TimeoutExpired:
+                results[(hook_name, payload_id)] = {"timed_out": True}
+        return results
+
+    results: dict[tuple[str, str], dict] = {}
+    if by_hook:
+        with ThreadPoolExecutor(max_workers=len(by_hook)) as pool:
+            for hook_results in pool.map(_one_hook, by_hook, by_hook.values()):
+                results.update(hook_results)
+    return results
+
+
+def _selected_runs(session: pytest.Session) -> set[tuple[str, str]]:
+    """(hook_name, payload_id) pairs needed by the collected items that use the batch.
+
+    Deselected cases (-m, -k) are absent from session.items, so e.g. the slow
+    payloads are never launched in a default run.
+    """
+    pairs = set()
+    for item in session.items:
+        if "hook_runs" in getattr(item, "fixturenames", ()):
+            params = item.callspec.params
+            pairs.add((params["hook_name"], params.get("payload_id", "std")))
+    return pairs
+
+
+@pytest.fixture(scope="module")
+def hook_runs(request) -> dict[tuple[str, str], dict]:
+    """Run the selected batch payloads against deployed hooks (raw output)."""
+    selected = _selected_runs(request.session)
+    hook_inputs = [
+        (hook_name, payload_id, payload)
+        for hook_name in _DEPLOYED_HOOKS
+        for payload_id, payload in _BATCH_PAYLOADS.items()
+        if (hook_name, payload_id) in selected
+    ]
+    return _run_batch(hook_inputs)
+
+
+@pytest.fixture(scope="module")
+def hook_results(hook_runs) -> dict[tuple[str, str], dict]:
+    """hook_runs with stdout parsed like run_hook() does."""
+    return {
+        key: run if run.get("timed_out")
+        else _parse_hook_output(run["stdout"], run["stderr"], run["returncode"])
+        for key, run in hook_runs.items()
+    }
+
+
+def _batched_result(results: dict, hook_name: str, payload_id: str) -> dict:
+    result = results[(hook_name, payload_id)]
+    if result.get("timed_out"):
+        pytest.fail(
+            f"{hook_name} did not finish within the {_BATCH_TIMEOUT}s batch "
+            f"({payload_id})"
+        )
+    return result
 
 
 class TestAllHooksExecutable:
@@ -66,26 +283,20 @@ class TestAllHooksExecutable:
         assert SETTINGS_PATH.exists(), "settings.json must exist"
 
     def test_settings_json_valid(self):
-        data = json.loads(SETTINGS_PATH.read_text(encoding="utf-8"))
-        assert isinstance(data, dict)
+        assert isinstance(load_settings(), dict)
 
-    @pytest.mark.parametrize("hook_name", ALL_HOOKS)
-    def test_hook_file_exists(self, hook_name):
-        hook_path = HOOKS_DIR / hook_name
-        assert hook_path.exists(), f"{hook_name} must exist in {HOOKS_DIR}"
+    def test_all_hooks_present(self):
+        missing = sorted(set(ALL_HOOKS) - set(_DEPLOYED_HOOKS))
+        assert ALL_HOOKS == _DEPLOYED_HOOKS, f"missing from {HOOKS_DIR}: {missing}"
 
-    @pytest.mark.parametrize("hook_name", ALL_HOOKS)
+    @pytest.mark.parametrize("hook_name", _DEPLOYED_HOOKS)
     def test_hook_is_python_parseable(self, hook_name):
         """Each hook must be valid Python (no syntax errors)."""
         hook_path = HOOKS_DIR / hook_name
-        result = subprocess.run(
-            [PYTHON, "-m", "py_compile", str(hook_path)],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            shell=False,
-        )
-        assert result.returncode == 0, f"{hook_name} has syntax error: {result.stderr}"
+        try:
+            _compile_hook(hook_path)
+        except SyntaxError as e:
+            pytest.fail(f"{hook_name} has syntax error: {e}")
 
 
 class TestUserPromptToSuggestion:
@@ -102,128 +313,57 @@ class TestUserPromptToSuggestion:
         assert result.get("returncode", 0) == 0
 
 
-class TestPostWriteOrchestratorChain:
-    """6.1: post-write-orchestrator chains lint-on-save → post-implementation-review."""
-
-    def test_orchestrator_returns_results_array(self):
-        result = run_hook("post-write-orchestrator.py", {
-            "tool_name": "Write",
-            "tool_input": {"file_path": "test.py"},
-        })
+class TestOrchestratorChain:
+    """6.1: orchestrators chain their two sub-hooks and report both results.
+
+    post-write-orchestrator: lint-on-save → post-implementation-review
+    post-bash-orchestrator:  post-test-analysis → log-cli-tools
+    """
+
+    @pytest.mark.parametrize("hook_name,payload,expected_scripts", [
+        (
+            "post-write-orchestrator.py",
+            {"tool_name": "Write", "tool_input": {"file_path": "main.py"}},
+            {"lint-on-save.py", "post-implementation-review.py"},
+        ),
+        (
+            "post-bash-orchestrator.py",
+            {
+                "tool_name": "Bash",
+                "tool_input": {"command": "pytest tests/"},
+                "tool_output": {"exit_code": 1, "stdout": "FAILED 2 tests"},
+            },
+            {"post-test-analysis.py", "log-cli-tools.py"},
+        ),
+    ])
+    def test_orchestrator_chain(self, hook_name, payload, expected_scripts):
+        result = run_hook(hook_name, payload)
         assert "results" in result or "orchestrator" in result
-
-    def test_orchestrator_has_two_sub_results(self):
-        result = run_hook("post-write-orchestrator.py", {
-            "tool_name": "Write",
-            "tool_input": {"file_path": "main.py"},
-        })
         if "results" in result:
             assert len(result["results"]) == 2
-            scripts = [r["script"] for r in result["results"]]
-            assert "lint-on-save.py" in scripts
-            assert "post-implementation-review.py" in scripts
-
-
-class TestPostBashOrchestratorChain:
-    """6.1: post-bash-orchestrator chains post-test-analysis → log-cli-tools."""
-
-    def test_orchestrator_returns_results_array(self):
-        result = run_hook("post-bash-orchestrator.py", {
-            "tool_name": "Bash",
-            "tool_input": {"command": "pytest tests/"},
-            "tool_output": {"exit_code": 1, "stdout": "FAILED 2 tests"},
-        })
-        assert "results" in result or "orchestrator" in result
-
-    def test_orchestrator_has_two_sub_results(self):
-        result = run_hook("post-bash-orchestrator.py", {
-            "tool_name": "Bash",
-            "tool_input": {"command": "pytest"},
-            "tool_output": {"exit_code": 0, "stdout": "passed"},
-        })
-        if "results" in result:
-            assert len(result["results"]) == 2
-            scripts = [r["script"] for r in result["results"]]
-            assert "post-test-analysis.py" in scripts
-            assert "log-cli-tools.py" in scripts
+            assert {r["script"] for r in result["results"]} == expected_scripts
 
 
 class TestHookFailSafeE2E:
     """6.1: All 10 hooks handle invalid input without crashing."""
 
-    @pytest.mark.parametrize("hook_name", ALL_HOOKS)
-    def test_none_values_no_crash(self, hook_name):
-        result = run_hook(hook_name, {
-            "tool_name": None,
-            "tool_input": None,
-            "prompt": None,
-            "result": None,
-        })
-        assert isinstance(result, dict)
-
-    @pytest.mark.parametrize("hook_name", ALL_HOOKS)
-    def test_numeric_fields_no_crash(self, hook_name):
-        result = run_hook(hook_name, {
-            "tool_name": 999,
-            "tool_input": 42,
-            "prompt": 0,
-        })
-        assert isinstance(result, dict)
-
-    @pytest.mark.parametrize("hook_name", ALL_HOOKS)
-    def test_empty_strings_no_crash(self, hook_name):
-        result = run_hook(hook_name, {
-            "tool_name": "",
-            "tool_input": "",
-            "prompt": "",
-            "result": "",
-        })
-        assert isinstance(result, dict)
-
-    @pytest.mark.parametrize("hook_name", ALL_HOOKS)
-    def test_unicode_content_no_crash(self, hook_name):
-        result = run_hook(hook_name, {
-            "tool_name": "Write",
-            "tool_input": {"file_path": "テスト.py"},
-            "prompt": "日本語プロンプト 🎉🚀",
-            "result": "結果: 成功 ✓",
-        })
-        assert isinstance(result, dict)
-
-    @pytest.mark.parametrize("hook_name", ALL_HOOKS)
-    def test_empty_dict_no_crash(self, hook_name):
-        result = run_hook(hook_name, {})
-        assert isinstance(result, dict)
-
-    @pytest.mark.parametrize("hook_name", ALL_HOOKS)
-    def test_large_payload_no_crash(self, hook_name):
-        result = run_hook(hook_name, {
-            "tool_name": "Write",
-            "tool_input": {"file_path": "big.py"},
-            "prompt": "x" * 50000,
-            "result": "y" * 50000,
-        }, timeout=30)
+    @pytest.mark.parametrize("hook_name", _DEPLOYED_HOOKS)
+    @pytest.mark.parametrize("payload_id", _FAILSAFE_CASES)
+    def test_payload_no_crash(self, payload_id, hook_name, hook_results):
+        result = _batched_result(hook_results, hook_name, payload_id)
         assert isinstance(result, dict)
 
 
 class TestHookOutputJsonFormat:
     """6.1: All hooks output valid JSON (or empty)."""
 
-    @pytest.mark.parametrize("hook_name", ALL_HOOKS)
-    def test_output_is_valid_json(self, hook_name):
-        hook_path = HOOKS_DIR / hook_name
-        result = subprocess.run(
-            [PYTHON, str(hook_path)],
-            input=json.dumps({"tool_name": "Write", "tool_input": {"file_path": "x.py"}}),
-            capture_output=True,
-            text=True,
-            timeout=15,
-            shell=False,
-        )
-        stdout = result.stdout.strip()
+    @pytest.mark.parametrize("hook_name", _DEPLOYED_HOOKS)
+    def test_output_is_valid_json(self, hook_name, hook_runs):
+        stdout = _batched_result(hook_runs, hook_name, "std")["stdout"].strip()
         if stdout:
-            parsed = json.loads(stdout)  # raises on invalid JSON
-            assert isinstance(parsed, dict)
+            assert _is_json_object(stdout), (
+                f"{hook_name} printed invalid JSON: {stdout[:200]!r}"
+            )
 
 
 class TestCodexAfterPlanSuggestion:
@@ -1,10 +1,12 @@
 """E2E 6.2 + 6.3: Skill integration — prompt.md existence, frontmatter schema,
 skill-hook interplay.
 """
+import functools
 import re
 from pathlib import Path
 
 import pytest
+from _file_cache import cached_read_text, cached_stat
 
 SKILLS_DIR = Path.home() / ".claude" / "skills"
 
@@ -31,19 +33,47 @@ EXPECTED_SKILLS = [
     "update-lib-docs",
 ]
 
+SKILL_PROMPTS = {name: SKILLS_DIR / name / "prompt.md" for name in EXPECTED_SKILLS}
+
+# Phase/step/section header counter for the startproject prompt
+_PHASE_RE = re.compile(r"phase|step|##", re.IGNORECASE)
+
+
+def _read_prompt(skill_name: str) -> str | None:
+    """Return a skill's prompt.md text (cached), or None if it is missing."""
+    prompt_path = SKILL_PROMPTS[skill_name]
+    if cached_stat(prompt_path) is None:
+        return None
+    return cached_read_text(prompt_path)
+
+
+def _read_frontmatter(skill_name: str) -> dict | None:
+    """Return a skill's parsed frontmatter (cached), or None if prompt.md is missing."""
+    prompt_path = SKILL_PROMPTS[skill_name]
+    if cached_stat(prompt_path) is None:
+        return None
+    return _frontmatter_cached(prompt_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _frontmatter_cached(path: Path) -> dict:
+    """Parse frontmatter once per prompt; shared by the schema tests."""
+    return _extract_frontmatter(cached_read_text(path))
+
 
 class TestSkillPromptFilesExist:
     """6.2: All 12 skills have prompt.md files."""
 
     @pytest.mark.parametrize("skill_name", EXPECTED_SKILLS)
     def test_prompt_md_exists(self, skill_name):
-        prompt_path = SKILLS_DIR / skill_name / "prompt.md"
-        assert prompt_path.exists(), f"{skill_name}/prompt.md must exist"
+        assert cached_stat(SKILL_PROMPTS[skill_name]) is not None, (
+            f"{skill_name}/prompt.md must exist"
+        )
 
     @pytest.mark.parametrize("skill_name", EXPECTED_SKILLS)
     def test_prompt_md_has_frontmatter(self, skill_name):
-        prompt_path = SKILLS_DIR / skill_name / "prompt.md"
-        content = prompt_path.read_text(encoding="utf-8")
+        content = _read_prompt(skill_name)
+        assert content is not None, f"{skill_name}/prompt.md must exist"
         assert content.startswith("---"), f"{skill_name}/prompt.md must start with YAML frontmatter"
         # Must have closing ---
         parts = content.split("---", 2)
@@ -57,16 +87,14 @@ class TestSkillFrontmatterSchema:
 
     @pytest.mark.parametrize("skill_name", EXPECTED_SKILLS)
     def test_frontmatter_has_name(self, skill_name):
-        prompt_path = SKILLS_DIR / skill_name / "prompt.md"
-        content = prompt_path.read_text(encoding="utf-8")
-        fm = _extract_frontmatter(content)
+        fm = _read_frontmatter(skill_name)
+        assert fm is not None, f"{skill_name}/prompt.md must exist"
         assert "name" in fm, f"{skill_name} frontmatter missing 'name'"
 
     @pytest.mark.parametrize("skill_name", EXPECTED_SKILLS)
     def test_frontmatter_name_nonempty(self, skill_name):
-        prompt_path = SKILLS_DIR / skill_name / "prompt.md"
-        content = prompt_path.read_text(encoding="utf-8")
-        fm = _extract_frontmatter(content)
+        fm = _read_frontmatter(skill_name)
+        assert fm is not None, f"{skill_name}/prompt.md must exist"
         assert fm.get("name", "").strip(), f"{skill_name} frontmatter 'name' is empty"
 
 
@@ -74,10 +102,10 @@ class TestPlanSkillTriggersCodexHook:
     """6.2: Plan skill prompt references Codex verification."""
 
     def test_plan_prompt_mentions_codex(self):
-        prompt_path = SKILLS_DIR / "plan" / "prompt.md"
-        if not prompt_path.exists():
+        content = _read_prompt("plan")
+        if content is None:
             pytest.skip("plan/prompt.md not found")
-        content = prompt_path.read_text(encoding="utf-8").lower()
+        content = content.lower()
         assert "codex" in content or "verify" in content or "review" in content, \
             "plan prompt should reference Codex verification"
 
@@ -86,10 +114,10 @@ class TestTddSkillRedGreenRefactor:
     """6.2: TDD skill prompt has Red-Green-Refactor phases."""
 
     def test_tdd_has_three_phases(self):
-        prompt_path = SKILLS_DIR / "tdd" / "prompt.md"
-        if not prompt_path.exists():
+        content = _read_prompt("tdd")
+        if content is None:
             pytest.skip("tdd/prompt.md not found")
-        content = prompt_path.read_text(encoding="utf-8").lower()
+        content = content.lower()
         assert "red" in content, "TDD prompt must mention Red phase"
         assert "green" in content, "TDD prompt must mention Green phase"
         assert "refactor" in content, "TDD prompt must mention Refactor phase"
@@ -99,12 +127,11 @@ class TestStartprojectSkillStructure:
     """6.2: startproject prompt has 7 phases."""
 
     def test_has_multiple_phases(self):
-        prompt_path = SKILLS_DIR / "startproject" / "prompt.md"
-        if not prompt_path.exists():
+        content = _read_prompt("startproject")
+        if content is None:
             pytest.skip("startproject/prompt.md not found")
-        content = prompt_path.read_text(encoding="utf-8")
         # Count phase/step/section headers
-        phase_matches = re.findall(r"(?:phase|step|##)", content, re.IGNORECASE)
+        phase_matches = _PHASE_RE.findall(content)
         assert len(phase_matches) >= 5, \
             f"startproject should have multiple phases/steps, found {len(phase_matches)}"
 
@@ -113,10 +140,10 @@ class TestCheckpointingSkillVaultPath:
     """6.2: checkpointing prompt references Vault path."""
 
     def test_mentions_vault(self):
-        prompt_path = SKILLS_DIR / "checkpointing" / "prompt.md"
-        if not prompt_path.exists():
+        content = _read_prompt("checkpointing")
+        if content is None:
             pytest.skip("checkpointing/prompt.md not found")
-        content = prompt_path.read_text(encoding="utf-8").lower()
+        content = content.lower()
         assert "vault" in content or "obsidian" in content or "tetsuyasynapse" in content.lower(), \
             "checkpointing prompt should reference Vault/Obsidian"
 
@@ -128,9 +155,8 @@ def _extract_frontmatter(content: str) -> dict:
     parts = content.split("---", 2)
     if len(parts) < 3:
         return {}
-    fm_text = parts[1].strip()
     result = {}
-    for line in fm_text.split("\n"):
+    for line in parts[1].strip().splitlines():
         if ":" in line:
             key, _, value = line.partition(":")
             result[key.strip()] = value.strip().strip('"').strip("'")
@@ -4,6 +4,7 @@ Tests checkpoint creation, local/vault dual-write, pending sync retry,
 and session state format.
 """
 import json
+import re
 from pathlib import Path
 
 import pytest
@@ -15,23 +16,29 @@ from vault_sync import (
     sync_pending,
 )
 
+_JSON_BLOCK_RE = re.compile(r"```json\s*\n(.*?)\n```", re.DOTALL)
+
+
+@pytest.fixture(scope="class")
+def checkpoint(shared_vault):
+    """Write one checkpoint per class; read-only tests share (path, text)."""
+    path = save_checkpoint("My Title", "Summary of work done", {"key": "val"})
+    return path, Path(path).read_text(encoding="utf-8") if path else ""
+
 
 class TestCheckpointCreatesLocalFile:
     """6.4: save_checkpoint() creates a local file."""
 
-    def test_creates_file(self, mock_vault):
-        path = save_checkpoint("Test Session", "Summary of work done", {"task": "testing"})
+    def test_creates_file(self, checkpoint):
+        path, _ = checkpoint
         assert path, "save_checkpoint must return a non-empty path"
         assert Path(path).exists(), f"File must exist at {path}"
 
-    def test_file_contains_title(self, mock_vault):
-        path = save_checkpoint("My Title", "Some summary", {})
-        content = Path(path).read_text(encoding="utf-8")
-        assert "My Title" in content
+    def test_file_contains_title(self, checkpoint):
+        assert "My Title" in checkpoint[1]
 
-    def test_file_has_frontmatter(self, mock_vault):
-        path = save_checkpoint("FM Test", "Summary", {"key": "val"})
-        content = Path(path).read_text(encoding="utf-8")
+    def test_file_has_frontmatter(self, checkpoint):
+        content = checkpoint[1]
         assert content.startswith("---")
         assert "checkpoint" in content
 
@@ -114,9 +121,9 @@ class TestSessionStateJsonFormat:
         # Must have Context section (when context provided)
         assert "## Context" in content
         # Context should be valid JSON
-        json_match = content.split("```json")[1].split("```")[0] if "```json" in content else ""
+        json_match = _JSON_BLOCK_RE.search(content)
         if json_match:
-            parsed = json.loads(json_match)
+            parsed = json.loads(json_match.group(1))
             assert "tasks" in parsed
 
 
@@ -1,4 +1,5 @@
 """Test 5.9: env_check module - environment validation."""
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
@@ -7,76 +8,88 @@ import pytest
 import env_check
 
 
-class TestCheckNode:
-    @patch("env_check.subprocess.run")
-    @patch("env_check.shutil.which", return_value="C:\\nodejs\\node.exe")
-    def test_node_available(self, mock_which, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0, stdout="v20.0.0\n", stderr=""
-        )
-        result = env_check.check_node()
-        assert result["available"] is True
-        assert result["version"] == "v20.0.0"
+pytestmark = pytest.mark.usefixtures("clear_which_cache")
 
-    @patch("env_check.shutil.which", return_value=None)
-    def test_node_not_found(self, mock_which):
-        result = env_check.check_node()
-        assert result["available"] is False
 
-    @patch("env_check.subprocess.run")
-    @patch("env_check.shutil.which", return_value="C:\\nodejs\\node.exe")
-    def test_node_nonzero_exit(self, mock_which, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=1, stdout="", stderr="error"
-        )
+@pytest.fixture
+def env_mocks(monkeypatch):
+    """Install subprocess.run / shutil.which mocks; configure via the namespace."""
+    mocks = SimpleNamespace(run=MagicMock(), which=MagicMock(return_value=None))
+    monkeypatch.setattr("env_check.subprocess.run", mocks.run)
+    monkeypatch.setattr("cli_finder.shutil.which", mocks.which)
+    return mocks
+
+
+_NODE_PATH = "C:\\nodejs\\node.exe"
+
+
+class TestCheckNode:
+    @pytest.mark.parametrize("scenario,which,run_result,available", [
+        (
+            "node_ok",
+            _NODE_PATH,
+            SimpleNamespace(returncode=0, stdout="v20.0.0\n", stderr=""),
+            True,
+        ),
+        ("node_not_found", None, None, False),
+        (
+            "node_nonzero",
+            _NODE_PATH,
+            SimpleNamespace(returncode=1, stdout="", stderr="error"),
+            False,
+        ),
+    ])
+    def test_check_node(self, env_mocks, scenario, which, run_result, available):
+        env_mocks.which.return_value = which
+        env_mocks.run.return_value = run_result
         result = env_check.check_node()
-        assert result["available"] is False
+        assert result["available"] is available
+        if scenario == "node_ok":
+            assert result["version"] == "v20.0.0"
+        if which is None:
+            env_mocks.run.assert_not_called()
 
 
 class TestCheckCodex:
-    @patch("env_check.subprocess.run")
-    @patch("cli_finder.find_node", return_value="node.exe")
-    @patch("cli_finder.find_codex_js", return_value="codex.js")
-    def test_codex_available(self, mock_codex, mock_node, mock_run):
-        mock_run.return_value = MagicMock(
+    def test_codex_available(self, env_mocks, monkeypatch):
+        monkeypatch.setattr("cli_finder.find_node", lambda: "node.exe")
+        monkeypatch.setattr("cli_finder.find_codex_js", lambda: "codex.js")
+        env_mocks.run.return_value = SimpleNamespace(
             returncode=0, stdout="0.92.0\n", stderr=""
         )
         result = env_check.check_codex()
         assert result["available"] is True
         assert result["version"] == "0.92.0"
 
-    @patch("cli_finder.find_node", side_effect=FileNotFoundError("no node"))
-    def test_codex_no_node(self, mock_node):
+    def test_codex_no_node(self, env_mocks, monkeypatch):
+        monkeypatch.setattr(
+            "cli_finder.find_node", MagicMock(side_effect=FileNotFoundError("no node"))
+        )
         result = env_check.check_codex()
         assert result["available"] is False
 
 
 class TestCheckGemini:
-    @patch("env_check.subprocess.run")
-    @patch("env_check.shutil.which", return_value="C:\\bin\\gemini.exe")
-    def test_gemini_available(self, mock_which, mock_run):
-        mock_run.return_value = MagicMock(
+    def test_gemini_available(self, env_mocks):
+        env_mocks.which.return_value = "C:\\bin\\gemini.exe"
+        env_mocks.run.return_value = SimpleNamespace(
             returncode=0, stdout="1.0.0\n", stderr=""
         )
         result = env_check.check_gemini()
         assert result["available"] is True
 
-    @patch("env_check.shutil.which", return_value=None)
-    def test_gemini_not_found_graceful(self, mock_which):
+    def test_gemini_not_found_graceful(self, env_mocks):
         result = env_check.check_gemini()
         assert result["available"] is False
         assert "degradation" in result
 
 
 class TestCheckPythonTools:
-    @patch("env_check.subprocess.run")
-    @patch("env_check.shutil.which")
-    def test_ruff_available(self, mock_which, mock_run):
-        def which_side(tool):
-            return "ruff.exe" if tool == "ruff" else None
-
-        mock_which.side_effect = which_side
-        mock_run.return_value = MagicMock(
+    def test_ruff_available(self, env_mocks):
+        env_mocks.which.side_effect = lambda tool: (
+            "ruff.exe" if tool == "ruff" else None
+        )
+        env_mocks.run.return_value = SimpleNamespace(
             returncode=0, stdout="ruff 0.8.0\n", stderr=""
         )
         result = env_check.check_python_tools()
@@ -98,18 +111,42 @@ class TestCheckVault:
         assert "degradation" in result
 
 
+def _checks(node, codex, gemini, ruff, vault) -> dict:
+    """mocked_env spec for full_check's five probes."""
+    return {
+        "env_check.check_node": {"available": node},
+        "env_check.check_codex": {"available": codex},
+        "env_check.check_gemini": {"available": gemini},
+        "env_check.check_python_tools": {
+            "ruff": {"available": ruff},
+            "ty": {"available": False},
+            "uv": {"available": False},
+        },
+        "env_check.check_vault": {"available": vault},
+    }
+
+
 class TestFullCheck:
-    @patch("env_check.check_vault", return_value={"available": False})
-    @patch("env_check.check_python_tools", return_value={
-        "ruff": {"available": True}, "ty": {"available": False}, "uv": {"available": False}
-    })
-    @patch("env_check.check_gemini", return_value={"available": False})
-    @patch("env_check.check_codex", return_value={"available": True})
-    @patch("env_check.check_node", return_value={"available": True})
-    def test_capabilities_matrix(self, *mocks):
+    @pytest.mark.parametrize("mocked_env,expected_caps", [
+        (
+            _checks(node=True, codex=True, gemini=False, ruff=True, vault=False),
+            {
+                "codex_delegation": True,
+                "gemini_delegation": False,
+                "lint_on_save": True,
+                "vault_sync": False,
+            },
+        ),
+        (
+            _checks(node=False, codex=True, gemini=True, ruff=False, vault=True),
+            {
+                "codex_delegation": False,
+                "gemini_delegation": True,
+                "lint_on_save": False,
+                "vault_sync": True,
+            },
+        ),
+    ], indirect=["mocked_env"])
+    def test_capabilities_matrix(self, mocked_env, expected_caps):
         result = env_check.full_check()
-        caps = result["capabilities"]
-        assert caps["codex_delegation"] is True
-        assert caps["gemini_delegation"] is False
-        assert caps["lint_on_save"] is True
-        assert caps["vault_sync"] is False
+        assert result["capabilities"] == expected_caps
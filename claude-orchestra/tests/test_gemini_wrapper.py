@@ -1,18 +1,22 @@
 """Test 5.12: gemini_wrapper module - Gemini CLI with graceful degradation."""
 import json
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 import gemini_wrapper
 
 
+pytestmark = pytest.mark.usefixtures("clear_which_cache")
+
+
 class TestFindGemini:
-    @patch("gemini_wrapper.shutil.which", return_value="C:\\bin\\gemini.exe")
+    @patch("cli_finder.shutil.which", return_value="C:\\bin\\gemini.exe")
     def test_found(self, mock_which):
         assert gemini_wrapper.find_gemini() == "C:\\bin\\gemini.exe"
 
-    @patch("gemini_wrapper.shutil.which", return_value=None)
+    @patch("cli_finder.shutil.which", return_value=None)
     def test_not_found(self, mock_which):
         assert gemini_wrapper.find_gemini() is None
 
@@ -29,7 +33,7 @@ class TestCallGemini:
     @patch("gemini_wrapper.find_gemini", return_value="gemini.exe")
     def test_json_response(self, mock_find, mock_guard, mock_run):
         response = {"result": "Python 3.13 is latest", "sources": ["python.org"]}
-        mock_run.return_value = MagicMock(
+        mock_run.return_value = SimpleNamespace(
             returncode=0, stdout=json.dumps(response), stderr=""
         )
         result = gemini_wrapper.call_gemini("latest Python version")
@@ -41,7 +45,7 @@ class TestCallGemini:
     @patch("gemini_wrapper.guard_context", side_effect=lambda c, **kw: c)
     @patch("gemini_wrapper.find_gemini", return_value="gemini.exe")
     def test_raw_text_response(self, mock_find, mock_guard, mock_run):
-        mock_run.return_value = MagicMock(
+        mock_run.return_value = SimpleNamespace(
             returncode=0, stdout="Some plain text research result", stderr=""
         )
         result = gemini_wrapper.call_gemini("research something")
@@ -53,7 +57,7 @@ class TestCallGemini:
     @patch("gemini_wrapper.guard_context", side_effect=lambda c, **kw: c)
     @patch("gemini_wrapper.find_gemini", return_value="gemini.exe")
     def test_empty_output(self, mock_find, mock_guard, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_run.return_value = SimpleNamespace(returncode=0, stdout="", stderr="")
         result = gemini_wrapper.call_gemini("query")
         assert result["success"] is False
         assert result["error"] == "empty_output"
@@ -0,0 +1,69 @@
+"""Tests for the in-process hook runner behind the persistent hook server."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from _hook_server import HookPool, HookWorker, run_hook_in_process
+
+
+def _write_hook(tmp_path):
+    """A hook whose imported helper sets an env var at import time (like bootstrap)."""
+    lib = tmp_path / "lib"
+    lib.mkdir()
+    (lib / "sidefx_helper.py").write_text(
+        'import os\nos.environ["ORCHESTRA_TEST_SIDEFX"] = "1"\n', encoding="utf-8"
+    )
+    hook = tmp_path / "hook.py"
+    hook.write_text(
+        "import os, sys\n"
+        f"sys.path.insert(0, {str(lib)!r})\n"
+        "import sidefx_helper\n"
+        'print(os.environ.get("ORCHESTRA_TEST_SIDEFX"))\n',
+        encoding="utf-8",
+    )
+    return str(hook)
+
+
+class TestRunHookInProcess:
+    def test_import_side_effects_rerun_each_invocation(self, tmp_path):
+        hook = _write_hook(tmp_path)
+        outputs = [run_hook_in_process(hook, "{}")["stdout"].strip() for _ in range(3)]
+        assert outputs == ["1", "1", "1"]
+
+    def test_process_state_restored(self, tmp_path):
+        hook = _write_hook(tmp_path)
+        path_before = list(sys.path)
+        result = run_hook_in_process(hook, "{}")
+        assert result["returncode"] == 0
+        assert "ORCHESTRA_TEST_SIDEFX" not in os.environ
+        assert "sidefx_helper" not in sys.modules
+        assert sys.path == path_before
+
+
+class TestHookWorker:
+    def test_hung_hook_times_out(self, tmp_path):
+        hook = tmp_path / "hung.py"
+        hook.write_text("import time\ntime.sleep(60)\n", encoding="utf-8")
+        worker = HookWorker()
+        try:
+            with pytest.raises(subprocess.TimeoutExpired):
+                worker.run(str(hook), "{}", timeout=0.5)
+            assert not worker.alive
+        finally:
+            worker.close()
+
+
+class TestHookPool:
+    def test_server_killing_hook_falls_back_to_subprocess(self, tmp_path):
+        hook = tmp_path / "exits.py"
+        hook.write_text(
+            'import os\nprint("{}", flush=True)\nos._exit(0)\n', encoding="utf-8"
+        )
+        pool = HookPool()
+        try:
+            results = [pool.run(str(hook), "{}", timeout=10) for _ in range(2)]
+        finally:
+            pool.close()
+        assert [r["stdout"].strip() for r in results] == ["{}", "{}"]
@@ -1,6 +1,9 @@
 """Test 5.2: Import chain verification for all lib modules."""
 import importlib
+import json
+import subprocess
 import sys
+from pathlib import Path
 
 import pytest
 
@@ -19,14 +22,49 @@ MODULE_NAMES = [
     "bootstrap",
 ]
 
+# Heavy stdlib modules the lib defers to first use; importing the lib alone
+# must not pull them in.
+LAZY_DEPENDENCIES = ["tempfile", "logging.handlers", "concurrent.futures"]
+
+_LIB_DIR = Path(__file__).resolve().parent.parent / "lib"
+
+_COLD_IMPORT_SCRIPT = """
+import importlib, json, sys
+sys.path.insert(0, sys.argv[1])
+for name in sys.argv[2:]:
+    importlib.import_module(name)
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+@pytest.fixture(scope="session")
+def imported_modules() -> dict:
+    """Import every lib module once for the whole session."""
+    return {name: importlib.import_module(name) for name in MODULE_NAMES}
+
+
+@pytest.fixture(scope="module")
+def fresh_imports() -> dict:
+    """Purge and re-import all lib modules once, then restore the originals.
+
+    Restoring keeps module objects that other tests already hold references
+    to (and monkeypatch) identical to what later `import` statements return.
+    """
+    saved = {
+        name: sys.modules.pop(name) for name in MODULE_NAMES if name in sys.modules
+    }
+    try:
+        return {name: importlib.import_module(name) for name in MODULE_NAMES}
+    finally:
+        sys.modules.update(saved)
+
 
 class TestImportChain:
     """Verify all library modules can be imported."""
 
     @pytest.mark.parametrize("module_name", MODULE_NAMES)
-    def test_module_imports(self, module_name):
-        mod = importlib.import_module(module_name)
-        assert mod is not None
+    def test_module_imports(self, module_name, imported_modules):
+        assert imported_modules[module_name] is not None
 
     def test_init_reexports(self):
         """__init__.py declares all expected module names in __all__."""
@@ -43,10 +81,17 @@ class TestImportChain:
         for name in expected:
             assert f'"{name}"' in content, f"Missing in __all__: {name}"
 
-    def test_no_circular_imports(self):
-        """Ensure importing all modules together doesn't crash."""
-        for name in MODULE_NAMES:
-            if name in sys.modules:
-                del sys.modules[name]
-        for name in MODULE_NAMES:
-            importlib.import_module(name)
+    def test_no_circular_imports(self, fresh_imports):
+        """Ensure importing all modules together from scratch doesn't crash."""
+        assert len(fresh_imports) == len(MODULE_NAMES)
+
+    def test_cold_import_defers_heavy_deps(self):
+        """A fresh interpreter importing every lib module loads no deferred deps."""
+        result = subprocess.run(
+            [sys.executable, "-c", _COLD_IMPORT_SCRIPT, str(_LIB_DIR), *MODULE_NAMES],
+            capture_output=True, text=True, timeout=30, shell=False,
+        )
+        assert result.returncode == 0, result.stderr
+        loaded = set(json.loads(result.stdout.splitlines()[-1]))
+        eager = [name for name in LAZY_DEPENDENCIES if name in loaded]
+        assert not eager, f"Imported at lib import time: {eager}"
@@ -33,32 +33,16 @@ class TestValidateOutput:
         assert result["valid"] is False
         assert any("approved" in e for e in result["errors"])
 
-    def test_confidence_out_of_range_high(self):
-        data = {
-            "approved": True,
-            "confidence": 15,
-            "issues": [],
-            "summary": "ok",
-        }
+    @pytest.mark.parametrize("conf,expected_valid", [
+        (-1, False), (0, False), (1, True), (5, True),
+        (10, True), (11, False), (15, False),
+    ])
+    def test_confidence_range(self, conf, expected_valid):
+        data = {"approved": True, "confidence": conf, "issues": [], "summary": "ok"}
         result = output_schemas.validate_output(data, "review")
-        assert result["valid"] is False
-        assert any("confidence" in e for e in result["errors"])
-
-    def test_confidence_out_of_range_low(self):
-        data = {
-            "approved": True,
-            "confidence": 0,
-            "issues": [],
-            "summary": "ok",
-        }
-        result = output_schemas.validate_output(data, "review")
-        assert result["valid"] is False
-
-    def test_confidence_valid_boundaries(self):
-        for conf in [1, 5, 10]:
-            data = {"approved": True, "confidence": conf, "issues": [], "summary": "ok"}
-            result = output_schemas.validate_output(data, "review")
-            assert result["valid"] is True, f"Failed for confidence={conf}"
+        assert result["valid"] is expected_valid, f"confidence={conf}"
+        if not expected_valid:
+            assert any("confidence" in e for e in result["errors"])
 
     def test_issue_missing_severity(self):
         data = {
@@ -6,39 +6,27 @@ import path_utils
 
 
 class TestNormalizePath:
-    def test_msys2_c_drive(self):
-        assert path_utils.normalize_path("/c/Users/skyeu") == "C:\\Users\\skyeu"
-
-    def test_msys2_d_drive(self):
-        assert path_utils.normalize_path("/d/projects") == "D:\\projects"
-
-    def test_msys2_uppercase_drive(self):
-        assert path_utils.normalize_path("/C/Users/skyeu") == "C:\\Users\\skyeu"
-
-    def test_windows_path_unchanged(self):
-        assert path_utils.normalize_path("C:\\Users\\skyeu") == "C:\\Users\\skyeu"
-
-    def test_empty_string(self):
-        assert path_utils.normalize_path("") == ""
-
-    def test_none_like_empty(self):
+    @pytest.mark.parametrize("p,expected", [
+        pytest.param("/c/Users/skyeu", "C:\\Users\\skyeu", id="msys2_c_drive"),
+        pytest.param("/d/projects", "D:\\projects", id="msys2_d_drive"),
+        pytest.param("/C/Users/skyeu", "C:\\Users\\skyeu", id="msys2_uppercase_drive"),
+        pytest.param(
+            "C:\\Users\\skyeu", "C:\\Users\\skyeu", id="windows_path_unchanged"
+        ),
         # normalize_path checks `if not path_str`
-        assert path_utils.normalize_path("") == ""
-
-    def test_drive_root_only(self):
-        assert path_utils.normalize_path("/c") == "C:"
-
-    def test_unix_absolute_non_drive(self):
+        pytest.param("", "", id="empty_string"),
+        pytest.param("/c", "C:", id="drive_root_only"),
         # /usr/bin should not match (not a single letter drive)
-        assert path_utils.normalize_path("/usr/bin") == "/usr/bin"
-
-    def test_relative_path_unchanged(self):
-        assert path_utils.normalize_path("src/main.py") == "src/main.py"
-
-    def test_forward_slashes_in_msys(self):
-        result = path_utils.normalize_path("/c/Users/skyeu/project/src")
-        assert "\\" in result
-        assert "/" not in result
+        pytest.param("/usr/bin", "/usr/bin", id="unix_absolute_non_drive"),
+        pytest.param("src/main.py", "src/main.py", id="relative_path_unchanged"),
+        pytest.param(
+            "/c/Users/skyeu/project/src",
+            "C:\\Users\\skyeu\\project\\src",
+            id="forward_slashes_in_msys",
+        ),
+    ])
+    def test_normalize(self, p, expected):
+        assert path_utils.normalize_path(p) == expected
 
 
 class TestToWindowsPath:
@@ -0,0 +1,85 @@
+"""Tests for scripts/claude_session_parser.py - incremental sync state."""
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "claude_session_parser.py"
+_spec = importlib.util.spec_from_file_location("claude_session_parser", _SCRIPT)
+claude_session_parser = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(claude_session_parser)
+
+
+def _line(ts: str, text: str) -> bytes:
+    message = {"role": "user", "content": text}
+    record = {"type": "user", "timestamp": ts, "message": message}
+    return json.dumps(record).encode("utf-8") + b"\n"
+
+
+def _offset(parser, path) -> int:
+    return parser.state["processed_bytes"][str(path)]
+
+
+def _contents(messages_by_date: dict) -> list[str]:
+    return [m.content for messages in messages_by_date.values() for m in messages]
+
+
+@pytest.fixture
+def vault(tmp_path):
+    return tmp_path / "vault"
+
+
+@pytest.fixture
+def parser(vault):
+    return claude_session_parser.ClaudeSessionParser(vault_path=str(vault))
+
+
+@pytest.fixture
+def session_file(tmp_path):
+    path = tmp_path / "session.jsonl"
+    path.write_bytes(
+        _line("2025-01-01T10:00:00Z", "first") + _line("2025-01-01T10:00:01Z", "second")
+    )
+    return path
+
+
+class TestIncrementalState:
+    def test_legacy_processed_lines_converted(self, vault, session_file):
+        state_file = vault / "90-Claude" / "sessions" / ".claude_parser_state.json"
+        state_file.parent.mkdir(parents=True)
+        state_file.write_text(
+            json.dumps({"processed_lines": {str(session_file): 1}}), encoding="utf-8"
+        )
+        parser = claude_session_parser.ClaudeSessionParser(vault_path=str(vault))
+
+        messages_by_date, _ = parser.parse_jsonl_incremental(session_file)
+
+        assert _contents(messages_by_date) == ["second"]
+        assert _offset(parser, session_file) == session_file.stat().st_size
+        assert str(session_file) not in parser.state["processed_lines"]
+
+    def test_shrunk_file_reread_from_start(self, parser, session_file):
+        size = session_file.stat().st_size
+        parser.state["processed_bytes"][str(session_file)] = size + 100
+
+        messages_by_date, _ = parser.parse_jsonl_incremental(session_file)
+
+        assert _contents(messages_by_date) == ["first", "second"]
+        assert _offset(parser, session_file) == session_file.stat().st_size
+
+    def test_partial_trailing_line_held_back(self, parser, tmp_path):
+        path = tmp_path / "growing.jsonl"
+        complete = _line("2025-01-01T10:00:00Z", "done")
+        pending = _line("2025-01-01T10:00:01Z", "pending")
+        path.write_bytes(complete + pending[:20])
+
+        messages_by_date, _ = parser.parse_jsonl_incremental(path)
+        assert _contents(messages_by_date) == ["done"]
+        assert _offset(parser, path) == len(complete)
+
+        with open(path, "ab") as f:
+            f.write(pending[20:])
+        messages_by_date, _ = parser.parse_jsonl_incremental(path)
+        assert _contents(messages_by_date) == ["pending"]
+        assert _offset(parser, path) == len(complete) + len(pending)
@@ -22,6 +22,12 @@ class TestSanitizeFilename:
         result = vault_sync._sanitize_filename("\uff21\uff22\uff23")
         assert result == "abc"
 
+    def test_normalization_is_cached(self):
+        vault_sync._normalize_nfkc.cache_clear()
+        vault_sync._sanitize_filename("\uff21\uff22\uff23")
+        vault_sync._sanitize_filename("\uff21\uff22\uff23")
+        assert vault_sync._normalize_nfkc.cache_info().hits == 1
+
     def test_control_chars_removed(self):
         result = vault_sync._sanitize_filename("hello\x00\x01world")
         assert "\x00" not in result
@@ -8,19 +8,58 @@ Claude Code Session Parser
 """
 
 import json
+import os
 import sys
 import io
 from pathlib import Path
 from datetime import datetime, date
 from dataclasses import dataclass, field
-from typing import Optional
-from collections import defaultdict
+from typing import Optional, Sequence
+from collections import Counter, defaultdict
 import re
 
-# Windows環境での文字化け対策
-if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+try:
+    # 任意依存: C実装で行ごとのJSONパースが速い（bytesをそのまま受け付ける）
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # 任意依存: C実装のISO 8601パーサー
+    from ciso8601 import parse_datetime as _parse_timestamp
+except ImportError:
+    if sys.version_info >= (3, 11):
+        # 3.11以降のfromisoformatは末尾の'Z'をそのまま受け付ける
+        _parse_timestamp = datetime.fromisoformat
+    else:
+        def _parse_timestamp(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+# _clean_content で除去するノイズ（メッセージごとに呼ばれるため事前コンパイル）
+# 4種類を1つのパターンにまとめ、本文の走査を1回で済ませる。
+# DOTALLはタグ/claudeMd部分だけに効かせる（ide_opened_file行を越えて消さないため）
+_NOISE_RE = re.compile(
+    r'<system-reminder>(?s:.*?)</system-reminder>'           # system-reminderタグ
+    r'|<local-command-[^>]*>(?s:.*?)</local-command-[^>]*>'  # local-commandタグ
+    r'|^ide_opened_file.*$'                                  # 内部メッセージ
+    r'|# claudeMd(?s:.*?)IMPORTANT:',                        # claudeMdタグ
+    re.MULTILINE,
+)
+
+# parse_jsonl_incremental が参照する値（cwd/version/メッセージtype）の生バイト表現
+_INCREMENTAL_KEYS = (b'"user"', b'"assistant"', b'"cwd"', b'"version"')
+
+# _slugify でファイル名から除く文字
+# （str.translateは日本語を含むタイトルだとre.subより遅かったため正規表現のまま）
+_SLUG_FORBIDDEN_RE = re.compile(r'[<>:"/\\|?*\n\r]')
+
+# ツール使用なしのメッセージで共有する空のtool_uses（不変なので共有しても安全）
+_NO_TOOL_USES: tuple = ()
+
+# メッセージ見出しのロール表示
+_LABEL_USER = "👤 User"
+_LABEL_CLAUDE = "🤖 Claude"
 
 
 @dataclass
@@ -31,7 +70,7 @@ class Message:
     content: str
     timestamp: datetime
     parent_uuid: Optional[str] = None
-    tool_uses: list = field(default_factory=list)
+    tool_uses: Sequence[dict] = field(default_factory=list)
 
 
 @dataclass
@@ -62,10 +101,14 @@ class ClaudeSessionParser:
         """処理状態を読み込む"""
         if self.state_file.exists():
             try:
-                return json.loads(self.state_file.read_text(encoding='utf-8'))
+                state = json.loads(self.state_file.read_text(encoding='utf-8'))
+                # 旧形式（processed_linesのみ）は
+                # 各ファイルの初回同期時にオフセットへ移行
+                state.setdefault("processed_bytes", {})
+                return state
             except (json.JSONDecodeError, IOError):
                 pass
-        return {"processed_lines": {}}
+        return {"processed_bytes": {}}
 
     def _save_state(self):
         """処理状態を保存"""
@@ -74,135 +117,138 @@ class ClaudeSessionParser:
             encoding='utf-8'
         )
 
-    def parse_jsonl_incremental(self, jsonl_path: Path) -> dict[date, list[Message]]:
-        """JSONLファイルを増分パースして日付ごとにメッセージを返す"""
+    def _processed_offset(self, file_key: str, jsonl_path: Path) -> int:
+        """処理済みバイト位置を返す（旧形式の行数はここでオフセットに変換）"""
+        offset = self.state["processed_bytes"].get(file_key)
+        if offset is not None:
+            return offset
+
+        legacy_lines = self.state.get("processed_lines", {}).pop(file_key, 0)
+        offset = 0
+        if legacy_lines:
+            with open(jsonl_path, 'rb') as f:
+                for _ in range(legacy_lines):
+                    line = f.readline()
+                    if not line:
+                        break
+                    offset += len(line)
+        return offset
+
+    def parse_jsonl_incremental(
+        self, jsonl_path: Path, save_state: bool = True
+    ) -> dict[date, list[Message]]:
+        """JSONLファイルを増分パースして日付ごとにメッセージを返す
+
+        save_state=False の場合は処理状態をメモリ上で更新するだけで、
+        保存は呼び出し側（sync_all）がまとめて行う。
+        """
         file_key = str(jsonl_path)
-        last_line = self.state["processed_lines"].get(file_key, 0)
+        offset = self._processed_offset(file_key, jsonl_path)
 
         messages_by_date: dict[date, list[Message]] = defaultdict(list)
         session_info = {"project_path": "", "version": ""}
-        current_line = 0
 
-        with open(jsonl_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                current_line += 1
+        # 処理済みのバイト位置まで読み飛ばし、新しい部分だけを読む
+        with open(jsonl_path, 'rb') as f:
+            if offset > f.seek(0, io.SEEK_END):
+                offset = 0  # ファイルが作り直された場合は先頭から
+            f.seek(offset)
+            new_bytes = f.read()
+        # 書き込み途中の末尾行は次回に回す（改行までを処理済みとする）
+        end = new_bytes.rfind(b'\n') + 1
+
+        for line in new_bytes[:end].splitlines():
+            line = line.strip()
+            if not line:
+                continue
 
-                # 既に処理済みの行はスキップ
-                if current_line <= last_line:
-                    continue
+            # 参照するキーを含まない行（summary等のイベント）はパース前に捨てる
+            if not any(key in line for key in _INCREMENTAL_KEYS):
+                continue
 
-                line = line.strip()
-                if not line:
-                    continue
+            try:
+                data = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
 
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
+            # セッション情報を抽出
+            if not session_info["project_path"] and 'cwd' in data:
+                session_info["project_path"] = data['cwd']
+            if not session_info["version"] and 'version' in data:
+                session_info["version"] = data['version']
 
-                # セッション情報を抽出
-                if not session_info["project_path"] and 'cwd' in data:
-                    session_info["project_path"] = data['cwd']
-                if not session_info["version"] and 'version' in data:
-                    session_info["version"] = data['version']
+            # メッセージを抽出
+            if data.get('type') in ('user', 'assistant') and 'message' in data:
+                msg_data = data['message']
+                msg_content = msg_data.get('content', [])
 
-                # メッセージを抽出
-                if data.get('type') in ('user', 'assistant') and 'message' in data:
-                    msg_data = data['message']
-                    msg_content = msg_data.get('content', [])
+                is_tool_result, content, tool_uses = self._walk_content(msg_content)
 
-                    # tool_resultメッセージはスキップ
-                    if self._is_tool_result(msg_content):
-                        continue
+                # tool_resultメッセージはスキップ
+                if is_tool_result:
+                    continue
 
-                    content = self._extract_content(msg_content)
-                    tool_uses = self._extract_tool_uses(msg_content)
+                # 空メッセージ、内部メッセージはスキップ
+                if not content and not tool_uses:
+                    continue
 
-                    # 空メッセージ、内部メッセージはスキップ
-                    if not content and not tool_uses:
-                        continue
+                timestamp = _parse_timestamp(data['timestamp'])
 
-                    timestamp = datetime.fromisoformat(
-                        data['timestamp'].replace('Z', '+00:00')
-                    )
-
-                    msg = Message(
-                        uuid=data.get('uuid', ''),
-                        role=msg_data.get('role', data['type']),
-                        content=content,
-                        timestamp=timestamp,
-                        parent_uuid=data.get('parentUuid'),
-                        tool_uses=tool_uses
-                    )
-
-                    # 日付ごとに分類
-                    msg_date = timestamp.date()
-                    messages_by_date[msg_date].append(msg)
-
-        # 処理済み行を更新
-        self.state["processed_lines"][file_key] = current_line
-        self._save_state()
+                msg = Message(
+                    uuid=data.get('uuid', ''),
+                    role=msg_data.get('role', data['type']),
+                    content=content,
+                    timestamp=timestamp,
+                    parent_uuid=data.get('parentUuid'),
+                    tool_uses=tool_uses
+                )
+
+                # 日付ごとに分類
+                msg_date = timestamp.date()
+                messages_by_date[msg_date].append(msg)
+
+        # 処理済み位置を更新
+        self.state["processed_bytes"][file_key] = offset + end
+        if save_state:
+            self._save_state()
 
         return messages_by_date, session_info
 
-    def _extract_content(self, content) -> str:
-        """contentからテキストを抽出"""
-        # 文字列の場合はそのまま返す（ユーザーメッセージ）
-        if isinstance(content, str):
-            return self._clean_content(content)
+    def _walk_content(self, content) -> tuple[bool, str, Sequence[dict]]:
+        """contentを1回だけ走査して (tool_resultか, テキスト, ツール使用) を返す"""
+        # 文字列の場合はそのまま返す（ユーザーメッセージ、ツール使用なし）
+        # 件数の大半を占めるので、厳密な型比較と共有の空タプルで割り当てを省く
+        if type(content) is str:
+            return False, self._clean_content(content), _NO_TOOL_USES
 
         # 配列の場合は各要素を処理（アシスタントメッセージ）
         texts = []
+        tools = []
         for item in content:
             if isinstance(item, dict):
-                if item.get('type') == 'text':
+                item_type = item.get('type')
+                if item_type == 'text':
                     texts.append(item.get('text', ''))
+                elif item_type == 'tool_use':
+                    tools.append({
+                        'name': item.get('name', ''),
+                        'input': item.get('input', {})
+                    })
+                elif item_type == 'tool_result':
+                    # tool_resultメッセージは破棄されるので残りは見ない
+                    return True, "", _NO_TOOL_USES
                 # thinkingは除外（内部的な思考プロセス）
             elif isinstance(item, str):
                 texts.append(item)
 
-        return self._clean_content('\n'.join(texts))
+        return False, self._clean_content('\n'.join(texts)), tools
 
     def _clean_content(self, text: str) -> str:
         """コンテンツからノイズを除去"""
         if not text:
             return ""
 
-        # system-reminderタグを除去
-        text = re.sub(r'<system-reminder>.*?</system-reminder>', '', text, flags=re.DOTALL)
-        # local-commandタグを除去
-        text = re.sub(r'<local-command-[^>]*>.*?</local-command-[^>]*>', '', text, flags=re.DOTALL)
-        # ide_opened_fileなどの内部メッセージを除去
-        text = re.sub(r'^ide_opened_file.*$', '', text, flags=re.MULTILINE)
-        # claudeMdタグを除去
-        text = re.sub(r'# claudeMd.*?IMPORTANT:', '', text, flags=re.DOTALL)
-
-        return text.strip()
-
-    def _extract_tool_uses(self, content) -> list:
-        """contentからツール使用を抽出"""
-        # 文字列の場合はツール使用なし
-        if isinstance(content, str):
-            return []
-
-        tools = []
-        for item in content:
-            if isinstance(item, dict) and item.get('type') == 'tool_use':
-                tools.append({
-                    'name': item.get('name', ''),
-                    'input': item.get('input', {})
-                })
-        return tools
-
-    def _is_tool_result(self, content) -> bool:
-        """tool_resultメッセージかどうかを判定"""
-        if isinstance(content, str):
-            return False
-
-        for item in content:
-            if isinstance(item, dict) and item.get('type') == 'tool_result':
-                return True
-        return False
+        return _NOISE_RE.sub('', text).strip()
 
     def append_to_daily_file(self, msg_date: date, messages: list[Message], session_info: dict):
         """日付ファイルにメッセージを追記"""
@@ -215,10 +261,9 @@ class ClaudeSessionParser:
             header = self._generate_header(msg_date, session_info)
             filepath.write_text(header, encoding='utf-8')
 
-        # メッセージを追記
+        # メッセージを追記（まとめて1回のwriteで書き込む）
         with open(filepath, 'a', encoding='utf-8') as f:
-            for msg in messages:
-                f.write(self._format_message(msg))
+            f.write(''.join(self._format_message(msg) for msg in messages))
 
     def _generate_header(self, msg_date: date, session_info: dict) -> str:
         """日付ファイルのヘッダーを生成"""
@@ -235,55 +280,66 @@ tags: [claude-session, auto-generated]
 
     def _format_message(self, msg: Message) -> str:
         """メッセージをMarkdown形式にフォーマット"""
-        lines = []
-        role_label = "👤 User" if msg.role == 'user' else "🤖 Claude"
-        time_str = msg.timestamp.strftime('%H:%M:%S')
-
-        lines.append(f"### {role_label} ({time_str})")
-        lines.append("")
+        role_label = _LABEL_USER if msg.role == 'user' else _LABEL_CLAUDE
+        text = f"### {role_label} ({msg.timestamp:%H:%M:%S})\n\n"
 
         if msg.content:
-            lines.append(msg.content)
-            lines.append("")
+            text += f"{msg.content}\n\n"
 
         if msg.tool_uses:
-            lines.append("**ツール使用:**")
-            for tool in msg.tool_uses:
-                lines.append(f"- `{tool['name']}`")
-            lines.append("")
+            text += "**ツール使用:**\n" + ''.join(
+                f"- `{tool['name']}`\n" for tool in msg.tool_uses
+            ) + "\n"
 
-        return '\n'.join(lines) + '\n'
+        return text
 
     def list_sessions(self, project_filter: str = None) -> list[Path]:
         """利用可能なセッションファイルを一覧"""
+        # os.scandirのDirEntryはstat結果を保持するため、走査とソートで再statしない
         sessions = []
-        for project_dir in self.CLAUDE_PROJECTS_DIR.iterdir():
-            if not project_dir.is_dir():
-                continue
+        with os.scandir(self.CLAUDE_PROJECTS_DIR) as projects:
+            for project_dir in projects:
+                if not project_dir.is_dir():
+                    continue
 
-            # プロジェクトフィルター
-            if project_filter and project_filter not in project_dir.name:
-                continue
+                # プロジェクトフィルター
+                if project_filter and project_filter not in project_dir.name:
+                    continue
 
-            # メインセッションのみ（agent-で始まらないもの）
-            for jsonl_file in project_dir.glob("*.jsonl"):
-                if not jsonl_file.name.startswith("agent-"):
-                    sessions.append(jsonl_file)
+                # メインセッションのみ（agent-で始まらないもの）
+                with os.scandir(project_dir.path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.endswith(".jsonl") and not name.startswith("agent-"):
+                            sessions.append((entry.stat().st_mtime, entry.path))
 
-        return sorted(sessions, key=lambda p: p.stat().st_mtime, reverse=True)
+        sessions.sort(key=lambda s: s[0], reverse=True)
+        return [Path(path) for _, path in sessions]
 
     def sync_all(self, project_filter: str = None):
         """すべてのセッションを同期（増分処理）"""
         sessions = self.list_sessions(project_filter)
         total_new = 0
 
+        # 日付ファイルごとにまとめ、1回の同期で各ファイルを1度だけ開く
+        # （ヘッダーには最初にその日付を持っていたセッションの情報を使う）
+        pending: dict[date, tuple[dict, list[Message]]] = {}
         for jsonl_path in sessions:
-            messages_by_date, session_info = self.parse_jsonl_incremental(jsonl_path)
+            messages_by_date, session_info = self.parse_jsonl_incremental(
+                jsonl_path, save_state=False
+            )
 
             for msg_date, messages in messages_by_date.items():
                 if messages:
-                    self.append_to_daily_file(msg_date, messages, session_info)
-                    total_new += len(messages)
+                    pending.setdefault(msg_date, (session_info, []))[1].extend(messages)
+
+        for msg_date, (session_info, messages) in pending.items():
+            self.append_to_daily_file(msg_date, messages, session_info)
+            total_new += len(messages)
+
+        # 状態は全ファイルの追記が終わってから1回だけ保存する
+        # （途中で失敗した場合は次回同じ範囲を再処理する）
+        self._save_state()
 
         return total_new
 
@@ -297,14 +353,14 @@ tags: [claude-session, auto-generated]
         version = ""
         timestamps = []
 
-        with open(jsonl_path, 'r', encoding='utf-8') as f:
+        with open(jsonl_path, 'rb') as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
 
                 try:
-                    data = json.loads(line)
+                    data = _json_loads(line)
                 except json.JSONDecodeError:
                     continue
 
@@ -319,16 +375,12 @@ tags: [claude-session, auto-generated]
                     msg_data = data['message']
                     msg_content = msg_data.get('content', [])
 
-                    if self._is_tool_result(msg_content):
+                    is_tool_result, content, tool_uses = self._walk_content(msg_content)
+                    if is_tool_result:
                         continue
 
-                    content = self._extract_content(msg_content)
-                    tool_uses = self._extract_tool_uses(msg_content)
-
                     if content or tool_uses:
-                        timestamp = datetime.fromisoformat(
-                            data['timestamp'].replace('Z', '+00:00')
-                        )
+                        timestamp = _parse_timestamp(data['timestamp'])
                         timestamps.append(timestamp)
                         messages.append(Message(
                             uuid=data.get('uuid', ''),
@@ -353,13 +405,10 @@ tags: [claude-session, auto-generated]
         user_messages = [m for m in session.messages if m.role == 'user' and m.content]
         first_topic = user_messages[0].content[:200] if user_messages else "（不明）"
 
-        tool_counts = {}
-        for msg in session.messages:
-            for tool in msg.tool_uses:
-                name = tool['name']
-                tool_counts[name] = tool_counts.get(name, 0) + 1
-
-        top_tools = sorted(tool_counts.items(), key=lambda x: -x[1])[:5]
+        tool_counts = Counter(
+            tool['name'] for msg in session.messages for tool in msg.tool_uses
+        )
+        top_tools = tool_counts.most_common(5)
 
         return {
             'first_topic': first_topic,
@@ -376,67 +425,50 @@ tags: [claude-session, auto-generated]
         topic_slug = self._slugify(summary['first_topic'][:50])
         filename = f"{date_str}_{time_str}_{topic_slug}.md"
 
-        md_content = self._generate_markdown(session, summary)
         output_path = self.sessions_dir / filename
-        output_path.write_text(md_content, encoding='utf-8')
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.writelines(self._iter_markdown(session, summary))
         return output_path
 
     def _slugify(self, text: str) -> str:
         """テキストをファイル名に使えるslugに変換"""
-        text = re.sub(r'[<>:"/\\|?*\n\r]', '', text)
+        text = _SLUG_FORBIDDEN_RE.sub('', text)
         text = text.strip()[:50]
         return text or "session"
 
-    def _generate_markdown(self, session: Session, summary: dict) -> str:
-        """Markdownコンテンツを生成"""
-        lines = [
-            "---",
-            f"session_id: {session.session_id}",
-            f"project: {session.project_path}",
-            f"claude_version: {session.version}",
-            f"date: {session.start_time.strftime('%Y-%m-%d')}",
-            f"start_time: {session.start_time.strftime('%H:%M:%S')}",
-            f"end_time: {session.end_time.strftime('%H:%M:%S')}",
-            f"duration_minutes: {summary['duration_minutes']:.1f}",
-            f"message_count: {summary['message_count']}",
-            "tags: [claude-session]",
-            "---",
-            "",
-            "# セッション要約",
-            "",
-            f"**開始トピック**: {summary['first_topic'][:200]}",
-            "",
-            "## 統計",
-            f"- メッセージ数: {summary['message_count']}",
-            f"- ユーザー入力: {summary['user_message_count']}",
-            f"- 所要時間: {summary['duration_minutes']:.1f}分",
-            "",
-            "## 使用ツール（Top 5）",
-        ]
-
-        for tool_name, count in summary['top_tools']:
-            lines.append(f"- {tool_name}: {count}回")
+    def _iter_markdown(self, session: Session, summary: dict):
+        """Markdownコンテンツを先頭から順に生成（全体を1つの文字列にしない）"""
+        yield f"""---
+session_id: {session.session_id}
+project: {session.project_path}
+claude_version: {session.version}
+date: {session.start_time.strftime('%Y-%m-%d')}
+start_time: {session.start_time.strftime('%H:%M:%S')}
+end_time: {session.end_time.strftime('%H:%M:%S')}
+duration_minutes: {summary['duration_minutes']:.1f}
+message_count: {summary['message_count']}
+tags: [claude-session]
+---
 
-        lines.extend(["", "---", "", "# 会話ログ", ""])
+# セッション要約
 
-        for msg in session.messages:
-            role_label = "👤 User" if msg.role == 'user' else "🤖 Claude"
-            time_str = msg.timestamp.strftime('%H:%M:%S')
+**開始トピック**: {summary['first_topic'][:200]}
 
-            lines.append(f"### {role_label} ({time_str})")
-            lines.append("")
+## 統計
+- メッセージ数: {summary['message_count']}
+- ユーザー入力: {summary['user_message_count']}
+- 所要時間: {summary['duration_minutes']:.1f}分
 
-            if msg.content:
-                lines.append(msg.content)
-                lines.append("")
+## 使用ツール（Top 5）
+"""
+        for tool_name, count in summary['top_tools']:
+            yield f"- {tool_name}: {count}回\n"
 
-            if msg.tool_uses:
-                lines.append("**ツール使用:**")
-                for tool in msg.tool_uses:
-                    lines.append(f"- `{tool['name']}`")
-                lines.append("")
+        yield "\n---\n\n# 会話ログ\n\n"
 
-        return '\n'.join(lines)
+        # 会話ログは日付ファイルと同じフォーマット
+        for msg in session.messages:
+            yield self._format_message(msg)
 
     def process_recent(self, limit: int = 5, project_filter: str = None):
         """最新のセッションを処理（レガシー）"""
@@ -462,6 +494,11 @@ def main():
     """メイン実行"""
     import argparse
 
+    # Windows環境での文字化け対策（import時ではなく実行時にのみ切り替える）
+    if sys.platform == 'win32':
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+
     arg_parser = argparse.ArgumentParser(
         description="Claude Codeセッション履歴をObsidianに保存"
     )
@@ -503,7 +540,7 @@ def main():
 
     # 状態リセット
     if args.reset:
-        session_parser.state = {"processed_lines": {}}
+        session_parser.state = {"processed_bytes": {}}
         session_parser._save_state()
         print("処理状態をリセットしました\n")
 